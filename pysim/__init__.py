@@ -9,4 +9,7 @@ from importlib.metadata import version
 __version__ = version(__name__)
 
 # Populate package namespace
-from pysim.pysim import Simulink, whereis_knee_jerk_model, plot
+from pysim.pysim import (
+    Simulink, SimulationFuture, DiskCache, sweep, launch_shared_engines,
+    enable_rich_logs, whereis_knee_jerk_model, plot
+)
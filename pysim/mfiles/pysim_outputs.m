@@ -0,0 +1,32 @@
+function values = pysim_outputs(model, out, varnames, use_logsout)
+%PYSIM_OUTPUTS Read the requested outputs from a simulation
+%   values = PYSIM_OUTPUTS(model, out, varnames, use_logsout) returns a
+%   cell array with each requested output of the SimulationOutput `out` as
+%   a column vector of doubles. If `use_logsout` is true, outputs that are
+%   logged signals are read from the signal logging Dataset; all other
+%   outputs are read from `out.<varname>`. Outputs that cannot be read are
+%   returned as [].
+
+logged = {};
+if use_logsout
+    try
+        logsout = out.get(get_param(model, 'SignalLoggingName'));
+        logged = logsout.getElementNames();
+    catch
+    end
+end
+
+values = cell(1, numel(varnames));
+for i = 1:numel(varnames)
+    try
+        if any(strcmp(logged, varnames{i}))
+            value = logsout.get(varnames{i}).Values.Data;
+        else
+            value = out.(varnames{i});
+        end
+        values{i} = double(value(:));
+    catch
+        values{i} = [];
+    end
+end
+end
@@ -0,0 +1,23 @@
+function varargout = pysim_run(model, start, stop, varnames, use_logsout, varargin)
+%PYSIM_RUN Simulate a Simulink model and return the requested outputs
+%   [v1, v2, ...] = PYSIM_RUN(model, start, stop, varnames, use_logsout)
+%   runs `model` from `start` to `stop` and returns each requested output
+%   as a column vector of doubles, see PYSIM_OUTPUTS.
+%
+%   PYSIM_RUN(..., Name, Value) passes additional options to `sim`. The
+%   value of 'RapidAcceleratorParameterSets' may be given as the name of a
+%   base workspace variable holding the parameter set.
+
+simargs = varargin;
+for i = 1:2:numel(simargs) - 1
+    if strcmp(simargs{i}, 'RapidAcceleratorParameterSets') ...
+            && ischar(simargs{i + 1})
+        simargs{i + 1} = evalin('base', simargs{i + 1});
+    end
+end
+
+out = sim(model, 'StartTime', sprintf('%.17g', start), ...
+    'StopTime', sprintf('%.17g', stop), simargs{:});
+
+varargout = pysim_outputs(model, out, varnames, use_logsout);
+end
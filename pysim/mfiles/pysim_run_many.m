@@ -0,0 +1,23 @@
+function results = pysim_run_many(model, start, stop, varnames, use_logsout, paramsets)
+%PYSIM_RUN_MANY Simulate a Simulink model for several parameter sets
+%   results = PYSIM_RUN_MANY(model, start, stop, varnames, use_logsout,
+%   paramsets) assigns the fields of each struct in the cell array
+%   `paramsets` to the base workspace and runs `model` from `start` to
+%   `stop`. Returns a cell array holding one struct of outputs per
+%   parameter set, see PYSIM_OUTPUTS.
+
+results = cell(1, numel(paramsets));
+for k = 1:numel(paramsets)
+    params = paramsets{k};
+    names = fieldnames(params);
+    for j = 1:numel(names)
+        assignin('base', names{j}, params.(names{j}));
+    end
+
+    out = sim(model, 'StartTime', sprintf('%.17g', start), ...
+        'StopTime', sprintf('%.17g', stop));
+
+    values = pysim_outputs(model, out, varnames, use_logsout);
+    results{k} = cell2struct(values, varnames, 2);
+end
+end
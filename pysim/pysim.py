@@ -11,17 +11,435 @@ signals that you want to log.
 """
 
 # Imports from standard library
+from concurrent.futures import ProcessPoolExecutor
 from importlib import resources
-from typing import Union, Dict
+from typing import Optional, Union, Dict, List, Tuple
+from multiprocessing import util
+from collections import OrderedDict
+from hashlib import blake2b
 from pathlib import Path
+import multiprocessing
+import subprocess
+import tempfile
+import itertools
+import logging
+import array
+import time
+import re
+import uuid
+import copy
+import os
 
 # Imports from third party packages
 from matlab import engine
-from rich import print
+import matlab
+from rich.logging import RichHandler
 import matplotlib.pyplot as plt
 import numpy as np
 
 
+log = logging.getLogger(__name__)
+
+# Model parameters, mapping names to values
+Params = Dict[str, Union[str, float, int, np.ndarray]]
+
+# Directory containing the MATLAB helper functions used by `Simulink`
+MFILES = Path(__file__).parent / 'mfiles'
+
+# Values of the Simulink `SimulationMode` parameter for each `Simulink` mode
+SIMULATION_MODES = {
+    'normal': 'normal',
+    'accelerator': 'accelerator',
+    'rapid': 'rapid-accelerator',
+}
+
+# Model held by each sweep worker process, see `sweep`
+_worker_model = None
+
+# MATLAB processes started by `launch_shared_engines`
+_shared_processes = []
+
+
+def _to_numpy(value) -> np.ndarray:
+    """
+    Convert a value returned by the MATLAB engine to a flat NumPy array
+
+    `matlab.double` arrays are read straight from their underlying double
+    buffer instead of element by element. Other values are flattened in
+    MATLAB's column-major order, which returns a view where possible.
+    """
+
+    data = getattr(value, '_data', None)
+    if isinstance(value, matlab.double) and data is not None:
+        return np.frombuffer(data, dtype=np.float64)
+    return np.asarray(value, dtype=np.float64, order='F').ravel(order='F')
+
+
+def _is_numeric(value) -> bool:
+    """
+    Check whether a parameter value can be passed to MATLAB as real doubles
+
+    Strings, complex values and sequences holding anything other than
+    booleans, integers or floats are left to the eval path.
+    """
+
+    types = (bool, int, float, np.generic, list, tuple, np.ndarray)
+    if not isinstance(value, types):
+        return False
+    try:
+        return np.asarray(value).dtype.kind in 'biuf'
+    except ValueError:
+        # Ragged sequences
+        return False
+
+
+def _to_matlab(value):
+    """
+    Convert a numeric parameter value to a MATLAB engine value
+
+    Scalars become doubles. Sequences and arrays become `matlab.double`
+    arrays, filled from a single column-major buffer when the engine exposes
+    one; 1-D values become row vectors.
+    """
+
+    if isinstance(value, (bool, int, float, np.number, np.bool_)):
+        return float(value)
+
+    arr = np.asarray(value, dtype=np.float64)
+    if arr.ndim < 2:
+        arr = arr.reshape(1, -1)
+
+    mdbl = matlab.double(size=arr.shape)
+    if isinstance(getattr(mdbl, '_data', None), array.array):
+        mdbl._data[:] = array.array('d', arr.tobytes(order='F'))
+        return mdbl
+    return matlab.double(arr.tolist())
+
+
+def _freeze(value):
+    """
+    Make a parameter value hashable, for use in cache keys
+
+    Values are normalized to plain Python types, so values that reach
+    MATLAB as the same doubles (e.g. `1`, `1.0` and `np.float64(1)`) give
+    the same key and the same `repr`, whatever the NumPy version.
+    """
+
+    real = (bool, int, float, np.bool_, np.integer, np.floating)
+    if isinstance(value, real):
+        return float(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple, np.ndarray)):
+        arr = np.asarray(value)
+        if arr.dtype.kind in 'biu':
+            arr = arr.astype(np.float64)
+        return (arr.shape, tuple(arr.ravel().tolist()))
+    return value
+
+
+def _read_outputs(outvars: list, results) -> dict:
+    """
+    Convert the outputs returned by `pysim_run` to a dictionary of arrays
+
+    Outputs that could not be read in MATLAB are empty and are left out.
+    """
+
+    out = {}
+    for var, result in zip(outvars, results):
+        value = _to_numpy(result)
+        if value.size == 0:
+            log.warning("Could not read '%s'", var)
+            continue
+        out[var] = value
+
+    return out
+
+
+class _EnginePool:
+    """
+    Reference-counted MATLAB engines shared between `Simulink` instances
+
+    Engines are keyed by a tag. An engine started by the pool is quit when
+    its last user releases it; an engine attached to a shared MATLAB session
+    is only disconnected, leaving the session running. Models loaded on an
+    engine are counted separately by `(tag, name)`, since models sharing an
+    engine and a name share one block diagram. Only models that pysim loaded
+    itself, on an engine it started, are closed when unused.
+    """
+
+    _engines: Dict[str, Tuple[engine.MatlabEngine, int]] = {}  # type: ignore
+    _shared: set = set()
+    _models: Dict[Tuple[str, str], int] = {}
+    _owned: set = set()
+
+    @classmethod
+    def acquire(
+        cls, tag: str='default', shared: bool=False
+    ) -> engine.MatlabEngine:  # type: ignore
+        """
+        Get the engine for a tag, starting or attaching to it if needed
+
+        Parameters
+        ----------
+        tag : str
+            Engine tag, by default 'default'. If `shared` is True, this is
+            the name of the shared MATLAB session.
+        shared : bool
+            Attach to a session shared with `matlab.engine.shareEngine`
+            instead of starting a new one, by default False
+        """
+
+        if tag in cls._engines:
+            eng, refs = cls._engines[tag]
+        elif shared:
+            eng, refs = engine.connect_matlab(tag), 0
+            cls._shared.add(tag)
+        else:
+            eng, refs = engine.start_matlab(), 0
+
+        cls._engines[tag] = (eng, refs + 1)
+        return eng
+
+    @classmethod
+    def release(cls, tag: str='default') -> None:
+        """
+        Release the engine for a tag, quitting it once it is unused
+
+        Parameters
+        ----------
+        tag : str
+            Engine tag, by default 'default'
+        """
+
+        if tag not in cls._engines:
+            return
+
+        eng, refs = cls._engines.pop(tag)
+        if refs > 1:
+            cls._engines[tag] = (eng, refs - 1)
+        elif tag in cls._shared:
+            cls._shared.discard(tag)
+        else:
+            eng.quit()
+
+    @classmethod
+    def acquire_model(cls, tag: str, name: str) -> bool:
+        """
+        Count a user of a model on an engine
+
+        Returns
+        -------
+        bool
+            True if this is the first user, i.e. the model must be loaded
+        """
+
+        refs = cls._models.get((tag, name), 0)
+        cls._models[(tag, name)] = refs + 1
+        return refs == 0
+
+    @classmethod
+    def release_model(cls, tag: str, name: str) -> bool:
+        """
+        Release a user of a model on an engine
+
+        Returns
+        -------
+        bool
+            True if this was the last user of a model pysim loaded on an
+            engine it started, i.e. the model can be closed without saving
+        """
+
+        refs = cls._models.pop((tag, name), 0)
+        if refs > 1:
+            cls._models[(tag, name)] = refs - 1
+            return False
+
+        owned = (tag, name) in cls._owned
+        cls._owned.discard((tag, name))
+        return refs == 1 and owned and tag not in cls._shared
+
+    @classmethod
+    def mark_owned(cls, tag: str, name: str) -> None:
+        """Record that pysim loaded a model itself"""
+        cls._owned.add((tag, name))
+
+    @classmethod
+    def owns_model(cls, tag: str, name: str) -> bool:
+        """Check whether pysim loaded a model itself"""
+        return (tag, name) in cls._owned
+
+
+class DiskCache:
+    """
+    On-disk store of simulation results, shared between processes
+
+    Results are stored as `{root}/{key[:2]}/{key}.npz`. Files are written
+    to a temporary file and renamed into place, so concurrent writers never
+    leave a partial result behind.
+
+    Attributes
+    ----------
+    root : Path
+        Cache directory
+
+    Methods
+    -------
+    key(*parts)
+        Hash the parts identifying a result
+    load(key: str)
+        Load a result, or None if it is not cached
+    save(key: str, out: dict)
+        Store a result
+    """
+
+    _PREFIX = 'out_'
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        """
+        Constructor for DiskCache class
+
+        Parameters
+        ----------
+        root : Union[str, Path]
+            Cache directory, created when the first result is saved
+        """
+
+        self.root = Path(root)
+
+    def key(self, *parts) -> str:
+        """Hash the parts identifying a result"""
+        return blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+    def load(self, key: str) -> Optional[dict]:
+        """
+        Load a result
+
+        Parameters
+        ----------
+        key : str
+            Key returned by `key`
+
+        Returns
+        -------
+        dict
+            Cached output variables, or None if the result is not cached
+        """
+
+        path = self._file(key)
+        if not path.exists():
+            return None
+
+        with np.load(path) as data:
+            return {
+                name[len(self._PREFIX):]: data[name]
+                for name in data.files if name.startswith(self._PREFIX)
+            }
+
+    def save(self, key: str, out: dict) -> None:
+        """
+        Store a result
+
+        Parameters
+        ----------
+        key : str
+            Key returned by `key`
+        out : dict
+            Output variables, as returned by `Simulink.run`
+        """
+
+        path = self._file(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Output names are prefixed so they cannot clash with the
+        # arguments of `np.savez` (e.g. an output named 'file')
+        arrays = {self._PREFIX + var: value for var, value in out.items()}
+
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, suffix='.tmp', delete=False
+        ) as f:
+            try:
+                np.savez(f, **arrays)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+
+    def _file(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.npz"
+
+
+class SimulationFuture:
+    """
+    Handle to a simulation running in the background
+
+    Attributes
+    ----------
+    status : str
+        One of 'running', 'done' or 'cancelled'
+
+    Methods
+    -------
+    done()
+        Check whether the simulation has finished
+    result(timeout: float=None)
+        Wait for the simulation and return its outputs
+    cancel()
+        Cancel the simulation
+    """
+
+    def __init__(self, future, outvars: list) -> None:
+        """
+        Constructor for SimulationFuture class
+
+        Parameters
+        ----------
+        future : matlab.engine.FutureResult
+            Future returned by a background call to `pysim_run`
+        outvars : list
+            Output variables returned by the simulation, in order
+        """
+
+        self.__future = future
+        self.__outvars = outvars
+        self.__out = None
+
+    def done(self) -> bool:
+        """Check whether the simulation has finished"""
+        return self.__future.done()
+
+    def cancel(self) -> bool:
+        """Cancel the simulation"""
+        return self.__future.cancel()
+
+    def result(self, timeout: Optional[float]=None) -> dict:
+        """
+        Wait for the simulation and return its outputs
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait before raising `TimeoutError`, by default None
+            (wait indefinitely)
+        """
+
+        if self.__out is None:
+            results = self.__future.result(timeout)
+            if len(self.__outvars) == 1:
+                results = (results,)
+            self.__out = _read_outputs(self.__outvars, results)
+
+        return self.__out
+
+    @property
+    def status(self) -> str:
+        """Status of the simulation, can be polled without blocking"""
+        if self.__future.cancelled():
+            return 'cancelled'
+        return 'done' if self.__future.done() else 'running'
+
+
 class Simulink:
     """
     Interface for running Simulink models
@@ -30,26 +448,44 @@ class Simulink:
     ----------=
     name : str
         Name of the model
+    mode : str
+        Simulation mode, one of 'normal', 'accelerator' or 'rapid'
     eng : matlab.engine.MatlabEngine
         MATLAB engine
 
     Methods
     -------
-    connect()
+    connect(shared_name: str=None)
         Connect to MATLAB engine, if not already connected
     disconnect()
         Disconnect from MATLAB engine
-    set_params(params: Dict[str, Union[str, float, int]])
+    set_params(params: Params)
         Set model parameters
+    set_workspace(params: Params)
+        Set variables in the MATLAB workspace
+    set_block_params(block: str, **params)
+        Set block parameters
     run(start: int=0, stop: int=30)
         Run model
+    run_async(start: int=0, stop: int=30)
+        Run model in the background
+    run_cached(params: Params, start: int=0, stop: int=30)
+        Set parameters and run model, reusing previous results
+    run_many(param_sets: List[Params], start: int=0, stop: int=30)
+        Run model once for each set of parameters
     """
 
     def __init__(
         self, 
         path: Union[str, Path], 
         outvars: list=['tout'], 
-        connect: bool=True
+        connect: bool=True,
+        cache_size: int=1024,
+        mode: str='normal',
+        signal_logging: bool=True,
+        engine_tag: Optional[str]=None,
+        shared_name: Optional[str]=None,
+        cache_dir: Optional[Union[str, Path]]=None
     ) -> None:
         """
         Constructor for Simulink class
@@ -64,66 +500,255 @@ class Simulink:
             `tout` is automatically added to the list of output variables.
         connect : bool
             Connect to MATLAB engine on initialization, by default True
+        cache_size : int
+            Maximum number of results kept by `run_cached`, by default 1024
+        mode : str
+            Simulation mode, by default 'normal'. 'accelerator' compiles the
+            model once on load; 'rapid' builds a rapid accelerator target on
+            the first run, after parameters have been set, and reuses it for
+            later runs. Numeric workspace parameters are applied to the built
+            target directly; string-valued workspace parameters and
+            `set_block_params` cannot be, so they cause the target to be
+            rebuilt on the next run.
+        signal_logging : bool
+            Read output variables from the model's logged signals
+            (`out.logsout`) when they are logged there, by default True.
+            Output variables that are not logged signals are still read
+            from `out.<outvar>`.
+        engine_tag : str
+            Models created with the same tag share one MATLAB engine (and
+            so one base workspace and, for the same .slx file, one loaded
+            block diagram), by default None (the model gets its own engine)
+        shared_name : str
+            Name of a shared MATLAB session to attach to on initialization
+            instead of starting an engine, by default None
+        cache_dir : Union[str, Path]
+            Directory of a `DiskCache` consulted by `run_cached` before
+            running the model, by default None (results are only cached in
+            memory)
         """
 
+        self._engine = None
+        self._connection_tag = None
+
         self.__path = Path(path)
         if not self.__path.exists():
             raise FileNotFoundError(f"Path '{path}' does not exist")
         
         self.__name = self.__path.stem
 
-        self.outvars = np.unique(outvars + ['tout']).tolist()
+        if mode not in SIMULATION_MODES:
+            raise ValueError(
+                f"Mode must be one of {list(SIMULATION_MODES)}, got '{mode}'"
+            )
+        self.__mode = mode
+        self.__signal_logging = signal_logging
+        if engine_tag is None:
+            engine_tag = f"_private-{uuid.uuid4().hex}"
+        self.__engine_tag = engine_tag
+        self.__rtp = f"pysim_rtp_{self.__name}"
+
+        self.outvars = list(dict.fromkeys([*outvars, 'tout']))
+
+        self._current_params = {}
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._disk_cache = DiskCache(cache_dir) if cache_dir else None
+        self._cmd_templates = {}
+        self._rtp_built = False
 
         if connect:
-            self.connect()
+            self.connect(shared_name)
         
-    def connect(self) -> None:
+    def connect(self, shared_name: Optional[str]=None) -> None:
         """
         Connect to MATLAB engine if not already connected and load the model
+
+        Parameters
+        ----------
+        shared_name : str
+            Name of a shared MATLAB session to attach to, e.g. one started
+            by `launch_shared_engines`. By default None, which starts (or
+            reuses) the engine for this model's `engine_tag`.
         """
 
-        if not hasattr(self, '__engine'):
-            print("[bold green]Connecting to MATLAB engine...[/bold green]")
-            self.__engine = engine.start_matlab()
+        if self._engine is None:
+            log.info("Connecting to MATLAB engine...")
+            tag = self.__engine_tag if shared_name is None else shared_name
+            self._engine = _EnginePool.acquire(
+                tag, shared=shared_name is not None
+            )
+            self._connection_tag = tag
             self.eng.addpath(str(self.__path.parent), nargout=0)
+            self.eng.addpath(str(MFILES), nargout=0)
+
+            log.info("Loading model...")
+            self.eng.workspace['model'] = self.name
+            # A model the user already has open is left as it is
+            first = _EnginePool.acquire_model(tag, self.name)
+            if first and not self.eng.bdIsLoaded(self.name):
+                self.eng.load_system(self.name, nargout=0)
+                _EnginePool.mark_owned(tag, self.name)
 
-            print("[bold green]Loading model...[/bold green]")
-            self.eng.eval(f"model = '{self.name}';", nargout=0)
-            self.eng.load_system(self.name, nargout=0)
+            if _EnginePool.owns_model(tag, self.name):
+                self.eng.set_param(
+                    self.name, 'SimulationMode', SIMULATION_MODES[self.mode],
+                    nargout=0
+                )
+                if self.signal_logging:
+                    self.eng.set_param(
+                        self.name, 'SignalLogging', 'on', nargout=0
+                    )
+            else:
+                log.warning(
+                    "Model '%s' was already open; its SimulationMode and "
+                    "SignalLogging settings are left unchanged.", self.name
+                )
+            self._rtp_built = False
         else:
-            print("[bold yellow]MATLAB engine already running.[/bold yellow]")
+            log.warning("MATLAB engine already running.")
 
     def disconnect(self) -> None:
         """
         Disconnect from MATLAB engine
+
+        Safe to call more than once, including on a partially initialized
+        model. The model is only closed if pysim loaded it on an engine it
+        started; models in shared sessions, or that were already open, are
+        left open. Failures to close the model or release the engine are
+        reported but not raised.
         """
 
-        if hasattr(self, '__engine'):
-            print("[bold green]Disconnecting from MATLAB engine...[/bold green]")
-            self.eng.close_system(self.name, nargout=0)
-            self.eng.quit()
-            del self.__engine
-        else:
-            print("[bold yellow]MATLAB engine not running.[/bold yellow]")
+        eng = getattr(self, '_engine', None)
+        if eng is None:
+            log.debug("MATLAB engine not running.")
+            return
+
+        log.info("Disconnecting from MATLAB engine...")
+        tag = self._connection_tag
+        self._engine = None
+        self._connection_tag = None
 
-    def set_params(self, params: Dict[str, Union[str, float, int]]) -> None:
+        try:
+            if _EnginePool.release_model(tag, self.name):
+                # Close without saving the settings applied by `connect`
+                eng.close_system(self.name, 0, nargout=0)
+        except Exception as e:
+            log.error("Could not close model: %s", e)
+
+        try:
+            _EnginePool.release(tag)
+        except Exception as e:
+            log.error("Could not release MATLAB engine: %s", e)
+
+    def set_params(self, params: Params) -> None:
         """
         Set model parameters
 
         Parameters
         ----------
-        params : Union[str, float, int]
+        params : Params
             Dictionary of model parameters. Keys are the parameter names and
             values are the parameter values.
         """
 
+        self.set_workspace(params)
+
+    def set_workspace(self, params: Params) -> None:
+        """
+        Set variables in the MATLAB workspace
+
+        Numeric values, including lists and arrays, are assigned directly as
+        doubles; other values are assigned by evaluating a MATLAB command.
+        In 'rapid' mode, once the target has been built, numeric values are
+        also applied to the rapid accelerator parameter set, so they must be
+        tunable parameters of the model; any other value causes the target to
+        be rebuilt on the next run.
+
+        Parameters
+        ----------
+        params : Params
+            Dictionary of workspace variables. Keys are the variable names
+            and values are the variable values.
+        """
+
+        self._current_params.update(params)
+
+        evals = {}
+        tunable = []
+        for key, value in params.items():
+            if _is_numeric(value):
+                self.eng.workspace[key] = _to_matlab(value)
+                tunable.append(key)
+            else:
+                evals[key] = value
+
+        # The command template only depends on the keys (and which values
+        # are strings), so it is built once per set of keys
         cmd = ""
+        if evals:
+            sig = tuple(
+                (key, isinstance(value, str)) for key, value in evals.items()
+            )
+            if sig not in self._cmd_templates:
+                self._cmd_templates[sig] = "".join(
+                    f"{key} = '%s'; " if is_str else f"{key} = %s; "
+                    for key, is_str in sig
+                )
+            cmd = self._cmd_templates[sig] % tuple(
+                value.replace("'", "''") if isinstance(value, str) else value
+                for value in evals.values()
+            )
+
+        # Only numeric values can be applied to a built target; anything
+        # else is picked up by rebuilding it on the next run
+        if self.mode == 'rapid' and self._rtp_built and evals:
+            self._invalidate_rtp()
+
+        # Before the first run the target is built from the workspace values
+        if self.mode == 'rapid' and self._rtp_built and tunable:
+            args = ", ".join(f"'{key}', {key}" for key in tunable)
+            cmd += (
+                f"{self.__rtp} = Simulink.BlockDiagram"
+                f".modifyTunableParameters({self.__rtp}, {args}); "
+            )
+
+        if cmd:
+            self.eng.eval(cmd, nargout=0)
+
+    def set_block_params(self, block: str, **params) -> None:
+        """
+        Set block parameters
+
+        All parameters are passed to a single `set_param` call so the model
+        is not recompiled between them. In 'rapid' mode this causes the
+        target to be rebuilt on the next run.
+
+        Parameters
+        ----------
+        block : str
+            Path to the block, e.g. 'knee_jerk_v1/Gain'
+        **params
+            Block parameter names and values. Non-string values are
+            converted with `str`.
+        """
+
+        args = []
         for key, value in params.items():
-            if isinstance(value, str):
-                value = f"'{value}'"
-            cmd += f"{key} = {value}; "
+            args += [key, value if isinstance(value, str) else str(value)]
+
+        self.eng.set_param(block, *args, nargout=0)
 
-        self.eng.eval(cmd, nargout=0)
+        if self.mode == 'rapid' and self._rtp_built:
+            self._invalidate_rtp()
+
+    def _invalidate_rtp(self) -> None:
+        """Rebuild the rapid accelerator target on the next run"""
+        log.info(
+            "Rapid accelerator target will be rebuilt on the next run to "
+            "apply non-tunable changes."
+        )
+        self._rtp_built = False
 
     def run(self, start: int=0, stop: int=30) -> dict:
         """
@@ -137,33 +762,216 @@ class Simulink:
             Stop time of simulation, by default 30
         """
 
-        # Run simulation
-        cmd = f"""
-        set_param(model, 'StartTime', '{start}', 'StopTime', '{stop}');
-        out = sim(model);
+        return self.run_async(start, stop).result()
+
+    def run_async(self, start: int=0, stop: int=30) -> SimulationFuture:
         """
-        self.eng.eval(cmd, nargout=0)
+        Run model in the background
 
-        # Read output variables
-        out = {}
-        for var in self.outvars:
-            try:
-                self.eng.eval(f"{var} = out.{var};", nargout=0)
-                out[var] = np.asarray(self.eng.workspace[var]).flatten()
-            except:
-                print(f"[bold red]Could not read '{var}'[/bold red]")
+        Parameters
+        ----------
+        start : int
+            Start time of simulation, by default 0
+        stop : int
+            Stop time of simulation, by default 30
+
+        Returns
+        -------
+        SimulationFuture
+            Handle to the running simulation
+        """
+
+        # Build the rapid accelerator target once, from the parameters set so
+        # far, and reuse it for later runs
+        args = []
+        if self.mode == 'rapid':
+            if not self._rtp_built:
+                log.info("Building rapid accelerator target...")
+                self.eng.eval(
+                    f"{self.__rtp} = Simulink.BlockDiagram"
+                    f".buildRapidAcceleratorTarget('{self.name}');",
+                    nargout=0
+                )
+                self._rtp_built = True
+            args = [
+                'RapidAcceleratorUpToDateCheck', 'off',
+                'RapidAcceleratorParameterSets', self.__rtp
+            ]
+
+        # Outputs are returned directly rather than read back from the
+        # MATLAB workspace
+        future = self.eng.pysim_run(
+            self.name, float(start), float(stop), self.outvars,
+            self.signal_logging, *args,
+            nargout=len(self.outvars), background=True
+        )
+        return SimulationFuture(future, self.outvars)
+
+    def run_cached(
+        self,
+        params: Params,
+        start: int=0,
+        stop: int=30
+    ) -> dict:
+        """
+        Set parameters and run model, reusing previous results
+
+        Results are cached on the workspace parameters applied so far
+        (updated with `params`), the output variables, the time range and
+        the modification time of the model file. Block parameters set with
+        `set_block_params` are not part of the key. The least recently used
+        result is evicted once `cache_size` results are stored. If
+        `cache_dir` was given, results missing from memory are looked up on
+        disk before the model is run, and new results are written there as
+        well.
+
+        Parameters
+        ----------
+        params : Params
+            Dictionary of model parameters, see `set_params`
+        start : int
+            Start time of simulation, by default 0
+        stop : int
+            Stop time of simulation, by default 30
+        """
+
+        applied = {**self._current_params, **params}
+        key = (
+            tuple(sorted((k, _freeze(v)) for k, v in applied.items())),
+            tuple(self.outvars), start, stop,
+            self.__path.stat().st_mtime_ns
+        )
+
+        # Parameters are applied even on a hit, so later calls to `run`
+        # simulate with them
+        self.set_params(params)
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return copy.deepcopy(self._cache[key])
+
+        out = None
+        if self._disk_cache is not None:
+            disk_key = self._disk_cache.key(str(self.__path.resolve()), *key)
+            out = self._disk_cache.load(disk_key)
+
+        if out is None:
+            out = self.run(start, stop)
+            if self._disk_cache is not None:
+                self._disk_cache.save(disk_key, out)
+
+        self._cache[key] = out
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        return copy.deepcopy(out)
+
+    def run_many(
+        self,
+        param_sets: List[Params],
+        start: int=0,
+        stop: int=30
+    ) -> List[dict]:
+        """
+        Run model once for each set of parameters
 
-        return out
+        All simulations run inside a single MATLAB call with Fast Restart
+        enabled, so the model is only initialized once. Fast Restart is
+        restored to its previous setting afterwards, so later calls to
+        `set_params`, `set_block_params` and `run` behave as before. In
+        'rapid' mode, which does not support Fast Restart, this falls back
+        to calling `set_params` and `run` for each set.
+
+        Parameters
+        ----------
+        param_sets : List[Params]
+            Model parameters for each simulation, see `set_params`. Values
+            must be numeric or strings; other values would be evaluated as
+            MATLAB source by `set_params`, which `run_many` cannot do.
+        start : int
+            Start time of simulation, by default 0
+        stop : int
+            Stop time of simulation, by default 30
+
+        Returns
+        -------
+        List[dict]
+            Output of each simulation, see `run`
+
+        Raises
+        ------
+        TypeError
+            If a parameter value is neither numeric nor a string
+        """
+
+        if not param_sets:
+            return []
+
+        # Marshal values as `set_workspace` does; values it would evaluate
+        # as MATLAB source are rejected rather than passed to the engine
+        paramsets = []
+        for params in param_sets:
+            converted = {}
+            for key, value in params.items():
+                if _is_numeric(value):
+                    converted[key] = _to_matlab(value)
+                elif isinstance(value, str):
+                    converted[key] = value
+                else:
+                    raise TypeError(
+                        f"Parameter '{key}' must be numeric or a string, got "
+                        f"{type(value).__name__}; use `set_params` and `run`"
+                    )
+            paramsets.append(converted)
+
+        if self.mode == 'rapid':
+            outs = []
+            for params in param_sets:
+                self.set_params(params)
+                outs.append(self.run(start, stop))
+            return outs
+
+        fast_restart = self.eng.get_param(self.name, 'FastRestart')
+        if fast_restart != 'on':
+            self.eng.set_param(self.name, 'FastRestart', 'on', nargout=0)
+        try:
+            results = self.eng.pysim_run_many(
+                self.name, float(start), float(stop), self.outvars,
+                self.signal_logging, paramsets, nargout=1
+            )
+        finally:
+            if fast_restart != 'on':
+                self.eng.set_param(
+                    self.name, 'FastRestart', fast_restart, nargout=0
+                )
+
+        for params in param_sets:
+            self._current_params.update(params)
+
+        return [
+            _read_outputs(self.outvars, [result[var] for var in self.outvars])
+            for result in results
+        ]
 
     @property
     def name(self) -> str:
         """Name of the model"""
         return self.__name
     
+    @property
+    def mode(self) -> str:
+        """Simulation mode"""
+        return self.__mode
+
+    @property
+    def signal_logging(self) -> bool:
+        """Whether outputs are read from logged signals"""
+        return self.__signal_logging
+
     @property
     def eng(self) -> engine.matlabengine.MatlabEngine:  # type: ignore
         """MATLAB engine"""
-        return self.__engine
+        return self._engine
 
     def __str__(self) -> str:
         return f"Simulink model: {self.name}"
@@ -178,6 +986,221 @@ class Simulink:
         self.disconnect()
 
 
+def _init_worker(
+    path: Union[str, Path],
+    outvars: list,
+    shared_names: Optional[multiprocessing.Queue]=None,
+    cache_dir: Optional[Union[str, Path]]=None
+) -> None:
+    """Load the model once per sweep worker process"""
+
+    global _worker_model
+    logging.getLogger('pysim').setLevel(logging.WARNING)
+    shared_name = shared_names.get() if shared_names is not None else None
+    _worker_model = Simulink(
+        path, outvars, shared_name=shared_name, cache_dir=cache_dir
+    )
+    util.Finalize(None, _worker_model.disconnect, exitpriority=10)
+
+
+def _run_worker(params: dict, start: int, stop: int) -> dict:
+    """Run one sweep task on the worker's persistent model"""
+
+    if _worker_model._disk_cache is not None:
+        return _worker_model.run_cached(params, start, stop)
+
+    _worker_model.set_params(params)
+    return _worker_model.run(start, stop)
+
+
+def sweep(
+    path: Union[str, Path],
+    param_grid: Dict[str, list],
+    outvars: list=['tout'],
+    start: int=0,
+    stop: int=30,
+    n_workers: Optional[int]=None,
+    shared_prefix: Optional[str]=None,
+    cache_dir: Optional[Union[str, Path]]=None
+) -> List[Tuple[tuple, dict]]:
+    """
+    Run a model over every combination of parameters in a grid
+
+    Each worker process starts one MATLAB engine (or attaches to a shared
+    session) and loads the model once, then reuses it for all of its tasks.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Path to the .slx file
+    param_grid : Dict[str, list]
+        Dictionary mapping parameter names to the values to sweep over
+    outvars : list
+        List of output variables from the model, see `Simulink`
+    start : int
+        Start time of simulation, by default 0
+    stop : int
+        Stop time of simulation, by default 30
+    n_workers : int
+        Number of worker processes, by default 2, or the number of shared
+        sessions found if `shared_prefix` is given. Each worker runs its own
+        MATLAB engine, and no more workers are started than there are
+        parameter combinations (or shared sessions).
+    shared_prefix : str
+        If given, each worker attaches to one of the running shared MATLAB
+        sessions named `f"{shared_prefix}{i}"` instead of starting its own
+        engine, see `launch_shared_engines`. By default None.
+    cache_dir : Union[str, Path]
+        If given, workers share a `DiskCache` in this directory and skip
+        parameter combinations that are already cached. By default None.
+
+    Returns
+    -------
+    List[Tuple[tuple, dict]]
+        `(param_tuple, out)` pairs, where `param_tuple` holds the parameter
+        values in the order of `param_grid` keys and `out` is the output of
+        `Simulink.run`
+    """
+
+    keys = list(param_grid.keys())
+    combos = list(itertools.product(*param_grid.values()))
+
+    if not combos:
+        return []
+
+    sessions = []
+    if shared_prefix is not None:
+        sessions = _find_shared_sessions(shared_prefix)
+        if not sessions:
+            raise RuntimeError(
+                f"No shared MATLAB sessions named '{shared_prefix}<i>' are "
+                "running, see `launch_shared_engines`"
+            )
+        n_workers = min(n_workers or len(sessions), len(sessions))
+
+    n_workers = max(1, min(n_workers or 2, len(combos)))
+
+    # Spawned workers start with an empty engine pool rather than forked
+    # handles to the parent's engines
+    ctx = multiprocessing.get_context('spawn')
+    shared_names = None
+    if sessions:
+        shared_names = ctx.Queue()
+        for name in sessions[:n_workers]:
+            shared_names.put(name)
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(path, outvars, shared_names, cache_dir)
+    ) as pool:
+        futures = [
+            pool.submit(_run_worker, dict(zip(keys, combo)), start, stop)
+            for combo in combos
+        ]
+        return [
+            (combo, future.result())
+            for combo, future in zip(combos, futures)
+        ]
+
+
+def _find_shared_sessions(name_prefix: str) -> List[str]:
+    """Names of running shared sessions `f"{name_prefix}{i}"`, ordered by i"""
+
+    pattern = re.compile(re.escape(name_prefix) + r'(\d+)')
+    matches = [pattern.fullmatch(name) for name in engine.find_matlab()]
+    return [
+        m.group(0)
+        for m in sorted(filter(None, matches), key=lambda m: int(m.group(1)))
+    ]
+
+
+def launch_shared_engines(
+    n: int, name_prefix: str='pysim_w', timeout: float=300
+) -> List[str]:
+    """
+    Start shared MATLAB sessions for sweep workers to attach to
+
+    Sessions are named `f"{name_prefix}{i}"` for `i` in `range(n)`; names
+    that are already shared are not started again. The sessions keep
+    running across sweeps until this Python process exits. If a session
+    exits before it is shared, or the timeout expires, the sessions started
+    by this call are terminated.
+
+    Parameters
+    ----------
+    n : int
+        Number of sessions
+    name_prefix : str
+        Prefix of the session names, by default 'pysim_w'
+    timeout : float
+        Seconds to wait for all sessions to become available, by default 300
+
+    Returns
+    -------
+    List[str]
+        Names of the shared sessions
+    """
+
+    names = [f"{name_prefix}{i}" for i in range(n)]
+    running = set(engine.find_matlab())
+
+    launched = []
+    for name in names:
+        if name in running:
+            continue
+        # stdin is kept open so the session does not exit on EOF
+        launched.append(subprocess.Popen(
+            [
+                'matlab', '-nodesktop', '-nosplash',
+                '-r', f"matlab.engine.shareEngine('{name}')"
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL
+        ))
+
+    deadline = time.monotonic() + timeout
+    while not set(names).issubset(engine.find_matlab()):
+        error = None
+        exited = [proc for proc in launched if proc.poll() is not None]
+        if exited:
+            error = RuntimeError(
+                f"MATLAB exited with code {exited[0].returncode} before "
+                "sharing its session"
+            )
+        elif time.monotonic() > deadline:
+            error = TimeoutError(
+                f"Shared MATLAB sessions not available after {timeout}s"
+            )
+
+        if error is not None:
+            for proc in launched:
+                if proc.poll() is None:
+                    proc.terminate()
+            raise error
+        time.sleep(1)
+
+    _shared_processes.extend(launched)
+    return names
+
+
+def enable_rich_logs(level: int=logging.INFO) -> None:
+    """
+    Print pysim log messages to the terminal with `rich`
+
+    Parameters
+    ----------
+    level : int
+        Minimum level of messages to print, by default `logging.INFO`
+    """
+
+    logger = logging.getLogger('pysim')
+    if not any(isinstance(h, RichHandler) for h in logger.handlers):
+        logger.addHandler(RichHandler())
+    logger.setLevel(level)
+
+
 def whereis_knee_jerk_model() -> Path:
     """
     Get path to the knee jerk model
@@ -0,0 +1,117 @@
+"""
+Test configuration
+
+Installs a minimal stand-in for the MATLAB Engine API when it is not
+available, so the pure-Python parts of pysim can be tested without MATLAB.
+"""
+
+# Imports from standard library
+import array
+import sys
+import types
+
+# Imports from third party packages
+import pytest
+
+try:
+    import matlab.engine  # noqa: F401
+except ImportError:
+
+    class double:
+        """Stand-in for `matlab.double` storing data column-major in `_data`"""
+
+        def __init__(self, initializer=None, size=None, is_complex=False):
+            if initializer is not None:
+                rows = [list(initializer)]
+                if initializer and isinstance(initializer[0], (list, tuple)):
+                    rows = [list(row) for row in initializer]
+                size = (len(rows), len(rows[0]) if rows else 0)
+                self._data = array.array(
+                    'd', [row[j] for j in range(size[1]) for row in rows]
+                )
+            else:
+                size = tuple(size or (0, 0))
+                n = 1
+                for dim in size:
+                    n *= dim
+                self._data = array.array('d', [0.0] * n)
+            self.size = tuple(size)
+
+    class MatlabEngine:
+        """Stand-in for `matlab.engine.MatlabEngine`"""
+
+    def _unavailable(*args, **kwargs):
+        raise RuntimeError("MATLAB is not available in the test environment")
+
+    engine = types.ModuleType('matlab.engine')
+    engine.MatlabEngine = MatlabEngine
+    engine.matlabengine = types.SimpleNamespace(MatlabEngine=MatlabEngine)
+    engine.start_matlab = _unavailable
+    engine.connect_matlab = _unavailable
+    engine.find_matlab = lambda: ()
+
+    matlab = types.ModuleType('matlab')
+    matlab.double = double
+    matlab.engine = engine
+
+    sys.modules['matlab'] = matlab
+    sys.modules['matlab.engine'] = engine
+
+
+class FakeEngine:
+    """Engine that records whether it was quit and which functions it ran"""
+
+    def __init__(self):
+        self.quit_calls = 0
+        self.calls = []
+        self.workspace = {}
+
+    def quit(self):
+        self.quit_calls += 1
+
+    def called(self, name):
+        """Recorded calls of one MATLAB function"""
+        return [call for call in self.calls if call[0] == name]
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls.append((name, *args))
+        return call
+
+
+class Started(list):
+    """Engines started by the fake MATLAB, plus the shared sessions"""
+
+
+@pytest.fixture
+def fake_matlab(monkeypatch):
+    """Empty engine pool backed by fake MATLAB engines"""
+
+    from pysim import pysim
+    from pysim.pysim import _EnginePool
+
+    monkeypatch.setattr(_EnginePool, '_engines', {})
+    monkeypatch.setattr(_EnginePool, '_shared', set())
+    monkeypatch.setattr(_EnginePool, '_models', {})
+    monkeypatch.setattr(_EnginePool, '_owned', set())
+
+    started = Started()
+
+    def start_matlab():
+        started.append(FakeEngine())
+        return started[-1]
+
+    monkeypatch.setattr(pysim.engine, 'start_matlab', start_matlab)
+    started.sessions = {'pysim_w0': FakeEngine()}
+    monkeypatch.setattr(
+        pysim.engine, 'connect_matlab', lambda name: started.sessions[name]
+    )
+    return started
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Empty model file"""
+    path = tmp_path / 'model.slx'
+    path.touch()
+    return path
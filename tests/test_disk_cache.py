@@ -0,0 +1,53 @@
+"""Tests for the on-disk result cache"""
+
+# Imports from third party packages
+import numpy as np
+import pytest
+
+# Imports from local package
+from pysim import DiskCache
+from pysim import pysim
+from pysim.pysim import _freeze
+
+
+def test_round_trip(tmp_path):
+    cache = DiskCache(tmp_path)
+    key = cache.key('model', 1.0)
+    out = {'tout': np.linspace(0, 1, 5), 'file': np.arange(3.0)}
+
+    cache.save(key, out)
+    loaded = cache.load(key)
+
+    assert (tmp_path / key[:2] / f"{key}.npz").exists()
+    assert loaded.keys() == out.keys()
+    for var in out:
+        np.testing.assert_array_equal(loaded[var], out[var])
+
+
+def test_missing_key(tmp_path):
+    cache = DiskCache(tmp_path)
+    assert cache.load(cache.key('missing')) is None
+
+
+def test_failed_save_leaves_no_files(tmp_path, monkeypatch):
+    def savez(*args, **kwargs):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(pysim.np, 'savez', savez)
+    cache = DiskCache(tmp_path)
+    key = cache.key('model')
+
+    with pytest.raises(OSError):
+        cache.save(key, {'tout': np.zeros(3)})
+
+    assert list((tmp_path / key[:2]).iterdir()) == []
+
+
+def test_key_ignores_numpy_scalar_types(tmp_path):
+    cache = DiskCache(tmp_path)
+    values = [0.25, np.float64(0.25), np.linspace(0, 0.5, 3)[1]]
+    keys = {cache.key(_freeze(value)) for value in values}
+    assert len(keys) == 1
+
+    assert _freeze(np.int64(2)) == _freeze(2) == _freeze(2.0)
+    assert _freeze(np.array([1, 2])) == _freeze([1.0, 2.0])
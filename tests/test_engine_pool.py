@@ -0,0 +1,111 @@
+"""Tests for the reference-counted MATLAB engine pool"""
+
+# Imports from third party packages
+import pytest
+
+# Imports from local package
+from pysim import Simulink
+from pysim.pysim import _EnginePool
+
+
+@pytest.fixture(autouse=True)
+def pool(fake_matlab):
+    return fake_matlab
+
+
+def test_acquire_reuses_engine_for_tag(pool):
+    first = _EnginePool.acquire('a')
+    second = _EnginePool.acquire('a')
+
+    assert first is second
+    assert len(pool) == 1
+
+
+def test_acquire_starts_engine_per_tag(pool):
+    assert _EnginePool.acquire('a') is not _EnginePool.acquire('b')
+    assert len(pool) == 2
+
+
+def test_release_quits_engine_after_last_user():
+    eng = _EnginePool.acquire('a')
+    _EnginePool.acquire('a')
+
+    _EnginePool.release('a')
+    assert eng.quit_calls == 0
+
+    _EnginePool.release('a')
+    assert eng.quit_calls == 1
+    assert 'a' not in _EnginePool._engines
+
+
+def test_release_unknown_tag_is_noop():
+    _EnginePool.release('missing')
+    assert _EnginePool._engines == {}
+
+
+def test_release_keeps_shared_session_running():
+    eng = _EnginePool.acquire('pysim_w0', shared=True)
+    _EnginePool.release('pysim_w0')
+
+    assert eng.quit_calls == 0
+    assert 'pysim_w0' not in _EnginePool._engines
+    assert 'pysim_w0' not in _EnginePool._shared
+
+
+def test_model_counted_per_tag_and_name():
+    assert _EnginePool.acquire_model('a', 'model')
+    _EnginePool.mark_owned('a', 'model')
+    assert not _EnginePool.acquire_model('a', 'model')
+    assert _EnginePool.acquire_model('b', 'model')
+
+    assert not _EnginePool.release_model('a', 'model')
+    assert _EnginePool.release_model('a', 'model')
+    assert not _EnginePool.release_model('a', 'model')
+
+
+def test_reconnect_after_shared_session_uses_own_engine(pool, path):
+    session = pool.sessions['pysim_w0']
+
+    sim = Simulink(path, shared_name='pysim_w0')
+    assert sim.eng is session
+    sim.disconnect()
+
+    sim.connect()
+    assert sim.eng is pool[0]
+    assert 'pysim_w0' not in _EnginePool._engines
+    sim.disconnect()
+
+    other = Simulink(path, shared_name='pysim_w0')
+    assert other.eng is session
+    other.disconnect()
+
+
+def test_model_loaded_by_pysim_is_closed_without_saving(pool, path):
+    sim = Simulink(path)
+    eng = sim.eng
+    sim.disconnect()
+
+    assert eng.called('load_system') == [('load_system', 'model')]
+    assert eng.called('close_system') == [('close_system', 'model', 0)]
+
+
+def test_model_already_open_is_left_alone(pool, path):
+    session = pool.sessions['pysim_w0']
+    session.bdIsLoaded = lambda name: True
+
+    sim = Simulink(path, shared_name='pysim_w0')
+    sim.disconnect()
+
+    assert session.called('load_system') == []
+    assert session.called('set_param') == []
+    assert session.called('close_system') == []
+
+
+def test_model_in_shared_session_is_not_closed(pool, path):
+    session = pool.sessions['pysim_w0']
+
+    sim = Simulink(path, shared_name='pysim_w0')
+    sim.disconnect()
+
+    assert session.called('load_system') == [('load_system', 'model')]
+    assert session.called('close_system') == []
@@ -0,0 +1,50 @@
+"""Tests for converting values between Python and MATLAB"""
+
+# Imports from third party packages
+import matlab
+import numpy as np
+import pytest
+
+# Imports from local package
+from pysim.pysim import _is_numeric, _to_matlab, _to_numpy
+
+
+@pytest.mark.parametrize('value', [
+    1, 2.5, True, np.float64(1), np.int32(3), [1, 2], (1.0, 2.0),
+    np.arange(4).reshape(2, 2),
+])
+def test_numeric_values(value):
+    assert _is_numeric(value)
+
+
+@pytest.mark.parametrize('value', [
+    'abc', ['a', 'b'], 1 + 2j, np.complex128(1), np.array([1 + 1j]),
+    [[1, 2], [3]], None,
+])
+def test_non_numeric_values(value):
+    assert not _is_numeric(value)
+
+
+def test_to_matlab_scalar():
+    assert _to_matlab(np.int64(3)) == 3.0
+    assert isinstance(_to_matlab(True), float)
+
+
+def test_to_matlab_fills_buffer_column_major():
+    mdbl = _to_matlab(np.array([[1, 2, 3], [4, 5, 6]]))
+
+    assert isinstance(mdbl, matlab.double)
+    assert tuple(mdbl.size) == (2, 3)
+    assert list(mdbl._data) == [1, 4, 2, 5, 3, 6]
+
+
+def test_to_matlab_vector_is_row():
+    mdbl = _to_matlab([1, 2, 3])
+
+    assert tuple(mdbl.size) == (1, 3)
+    assert list(mdbl._data) == [1, 2, 3]
+
+
+def test_to_numpy_reads_buffer():
+    mdbl = matlab.double([[1.0], [2.0], [3.0]])
+    np.testing.assert_array_equal(_to_numpy(mdbl), [1, 2, 3])
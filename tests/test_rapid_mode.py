@@ -0,0 +1,50 @@
+"""Tests for reusing the rapid accelerator target between runs"""
+
+# Imports from third party packages
+import pytest
+
+# Imports from local package
+from pysim import Simulink
+
+
+@pytest.fixture
+def model(fake_matlab, path):
+    return Simulink(path, mode='rapid')
+
+
+def builds(model):
+    return [
+        call for call in model.eng.called('eval')
+        if 'buildRapidAcceleratorTarget' in call[1]
+    ]
+
+
+def test_target_built_on_first_run(model):
+    assert builds(model) == []
+    model.run_async()
+    model.run_async()
+    assert len(builds(model)) == 1
+
+
+def test_numeric_params_reuse_target(model):
+    model.run_async()
+    model.set_params({'K': 2})
+    model.run_async()
+
+    assert len(builds(model)) == 1
+    assert any(
+        'modifyTunableParameters' in call[1]
+        for call in model.eng.called('eval')
+    )
+
+
+@pytest.mark.parametrize('change', [
+    lambda model: model.set_params({'solver': 'ode45'}),
+    lambda model: model.set_block_params('model/Gain', Gain=2),
+])
+def test_non_tunable_changes_rebuild_target(model, change):
+    model.run_async()
+    change(model)
+    model.run_async()
+
+    assert len(builds(model)) == 2
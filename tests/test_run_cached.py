@@ -0,0 +1,76 @@
+"""Tests for the in-memory result cache of `Simulink.run_cached`"""
+
+# Imports from third party packages
+import numpy as np
+import pytest
+
+# Imports from local package
+from pysim import Simulink
+
+
+@pytest.fixture
+def model(tmp_path):
+    """Unconnected model whose runs return the applied parameters"""
+
+    path = tmp_path / 'model.slx'
+    path.touch()
+    sim = Simulink(path, connect=False)
+
+    sim.runs = 0
+
+    def run(start=0, stop=30):
+        sim.runs += 1
+        return {
+            var: np.array([float(value)])
+            for var, value in sim._current_params.items()
+        }
+
+    sim.set_workspace = sim._current_params.update
+    sim.run = run
+    return sim
+
+
+def test_hit_returns_copy(model):
+    first = model.run_cached({'K': 1})
+    first['K'][0] = 99
+
+    assert model.run_cached({'K': 1})['K'][0] == 1
+    assert model.runs == 1
+
+
+def test_key_includes_previously_applied_params(model):
+    model.run_cached({'K': 1})
+    model.set_params({'beta': 2})
+    out = model.run_cached({'K': 1})
+
+    assert model.runs == 2
+    assert out['beta'][0] == 2
+
+
+def test_key_includes_outvars(model):
+    model.run_cached({'K': 1})
+    model.outvars.append('y')
+    model.run_cached({'K': 1})
+
+    assert model.runs == 2
+
+
+def test_lru_eviction(model):
+    model._cache_size = 2
+    for k in (1, 2, 3):
+        model.run_cached({'K': k})
+
+    assert len(model._cache) == 2
+    model.run_cached({'K': 2})
+    assert model.runs == 3
+    model.run_cached({'K': 1})
+    assert model.runs == 4
+
+
+def test_hit_applies_params(model):
+    model.run_cached({'K': 1})
+    model.set_params({'K': 2})
+    model.run_cached({'K': 1})
+
+    assert model.runs == 1
+    assert model._current_params['K'] == 1
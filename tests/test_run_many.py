@@ -0,0 +1,29 @@
+"""Tests for running several parameter sets with `Simulink.run_many`"""
+
+# Imports from third party packages
+import pytest
+
+# Imports from local package
+from pysim import Simulink
+
+
+@pytest.fixture
+def model(fake_matlab, path):
+    return Simulink(path)
+
+
+def test_empty_param_sets_do_not_touch_model(model):
+    calls = len(model.eng.calls)
+    assert model.run_many([]) == []
+    assert len(model.eng.calls) == calls
+
+
+@pytest.mark.parametrize('value', [None, [[1, 2], [3]], {'a': 1}])
+def test_values_set_params_would_evaluate_are_rejected(model, value):
+    with pytest.raises(TypeError, match="'K'"):
+        model.run_many([{'beta': 1}, {'K': value}])
+
+    assert not any(
+        'FastRestart' in call for call in model.eng.called('set_param')
+    )
+    assert model.eng.called('pysim_run_many') == []
@@ -0,0 +1,54 @@
+"""Tests for finding and launching shared MATLAB sessions"""
+
+# Imports from third party packages
+import pytest
+
+# Imports from local package
+from pysim import pysim
+
+
+class FakeProcess:
+    """MATLAB process that exits immediately, or keeps running"""
+
+    def __init__(self, returncode=None):
+        self.returncode = returncode
+        self.terminated = False
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.terminated = True
+        self.returncode = -15
+
+
+def test_find_shared_sessions_orders_by_index(monkeypatch):
+    monkeypatch.setattr(
+        pysim.engine, 'find_matlab',
+        lambda: ('pysim_w10', 'other', 'pysim_w2', 'pysim_wx', 'pysim_w0')
+    )
+    assert pysim._find_shared_sessions('pysim_w') == [
+        'pysim_w0', 'pysim_w2', 'pysim_w10'
+    ]
+
+
+def test_sweep_without_shared_sessions_fails_early(monkeypatch, tmp_path):
+    monkeypatch.setattr(pysim.engine, 'find_matlab', lambda: ())
+    with pytest.raises(RuntimeError, match='launch_shared_engines'):
+        pysim.sweep(tmp_path, {'K': [1, 2]}, shared_prefix='pysim_w')
+
+
+def test_launch_fails_fast_when_matlab_exits(monkeypatch):
+    procs = [FakeProcess(), FakeProcess(returncode=1)]
+    monkeypatch.setattr(pysim.engine, 'find_matlab', lambda: ())
+    monkeypatch.setattr(
+        pysim.subprocess, 'Popen', lambda *args, **kwargs: procs.pop(0)
+    )
+    monkeypatch.setattr(pysim, '_shared_processes', [])
+
+    running = procs[0]
+    with pytest.raises(RuntimeError, match='exited with code 1'):
+        pysim.launch_shared_engines(2, timeout=60)
+
+    assert running.terminated
+    assert pysim._shared_processes == []